@@ -7,6 +7,8 @@ def get_students_at_risk(db: Session, attendance_threshold: int = 75, grade_thre
             s.id AS student_id,
             s.name,
             s.student_code,
+            0 AS total_classes,
+            0 AS present_count,
             g.attendance_score AS attendance_percentage,
             g.term1,
             g.term2,
@@ -19,7 +21,8 @@ def get_students_at_risk(db: Session, attendance_threshold: int = 75, grade_thre
         ORDER BY g.attendance_score ASC
     """)
 
-    return db.execute(query, {"att_t": attendance_threshold, "grade_t": grade_threshold}).fetchall()
+    # Returned unfetched so callers can stream rows straight from the cursor
+    return db.execute(query, {"att_t": attendance_threshold, "grade_t": grade_threshold})
 
 def get_student_prediction_data(db: Session, student_id: int):
     query = text("""
@@ -38,4 +41,18 @@ def delete_student(db: Session, student_id: int):
     db.execute(text("DELETE FROM grades WHERE student_id = :s_id"), {"s_id": student_id})
     db.execute(text("DELETE FROM students WHERE id = :s_id"), {"s_id": student_id})
     db.commit()
-    return True
\ No newline at end of file
+    return True
+
+def get_risk_sweep_data(db: Session):
+    # Same join as get_students_at_risk, but without the threshold filter so a
+    # whole grid of thresholds can be evaluated from a single fetch.
+    query = text("""
+        SELECT 
+            g.term1,
+            g.term2,
+            g.term3,
+            g.attendance_score
+        FROM students s
+        INNER JOIN grades g ON s.id = g.student_id
+    """)
+    return db.execute(query).fetchall()
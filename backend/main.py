@@ -1,13 +1,15 @@
 import csv
 import io
 import os
-from fastapi import FastAPI, Depends, UploadFile, File
+import numpy as np
+from typing import Optional
+from fastapi import FastAPI, Depends, UploadFile, File, Query, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from backend.database import SessionLocal, init_db
-from backend import schemas, crud
+from backend import schemas, crud, risk_sweep, serialization
 from backend.models.predictor import StudentPredictor
 
 app = FastAPI(title="Smart Attendance System")
@@ -43,10 +45,55 @@ def get_db():
 def students_at_risk(
     attendance_threshold: int = 75,
     grade_threshold: int = 50,
+    accept: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
-    rows = crud.get_students_at_risk(db, attendance_threshold, grade_threshold)
-    return [dict(row._mapping) for row in rows]
+    result = crud.get_students_at_risk(db, attendance_threshold, grade_threshold)
+    # Returning a Response directly skips per-row response_model validation;
+    # response_model is kept for the OpenAPI docs.
+    return serialization.rows_response(result, serialization.AT_RISK_SCHEMA, accept)
+
+@app.get("/attendance/at-risk/sweep", response_model=schemas.RiskSweep)
+def students_at_risk_sweep(
+    attendance_min: int = Query(0, ge=0, le=100),
+    attendance_max: int = Query(100, ge=0, le=100),
+    attendance_step: int = Query(1, ge=1),
+    grade_min: int = Query(0, ge=0, le=100),
+    grade_max: int = Query(100, ge=0, le=100),
+    grade_step: int = Query(1, ge=1),
+    include_predictions: bool = False,
+    db: Session = Depends(get_db)
+):
+    # One fetch for the whole grid instead of one /attendance/at-risk call per slider position
+    if attendance_min > attendance_max or grade_min > grade_max:
+        raise HTTPException(status_code=400, detail="Threshold min must not exceed max.")
+
+    att_thresholds = risk_sweep.threshold_grid(attendance_min, attendance_max, attendance_step)
+    grade_thresholds = risk_sweep.threshold_grid(grade_min, grade_max, grade_step)
+
+    rows = crud.get_risk_sweep_data(db)
+    data = np.array(rows, dtype=float).reshape(-1, 4)
+    attendance = data[:, 3]
+    min_grade = data[:, :3].min(axis=1)
+
+    at_risk = risk_sweep.count_at_risk_grid(attendance, min_grade, att_thresholds, grade_thresholds)
+
+    predicted_fail = None
+    if include_predictions:
+        predictions = predictor.predict_batch(data)
+        if predictions is not None:
+            failing = predictions == 0
+            predicted_fail = risk_sweep.count_at_risk_grid(
+                attendance[failing], min_grade[failing], att_thresholds, grade_thresholds
+            ).tolist()
+
+    return {
+        "attendance_thresholds": att_thresholds,
+        "grade_thresholds": grade_thresholds,
+        "total_students": len(data),
+        "at_risk": at_risk.tolist(),
+        "predicted_fail": predicted_fail
+    }
 
 @app.get("/stats")
 def get_stats(db: Session = Depends(get_db)):
@@ -59,7 +106,7 @@ def get_stats(db: Session = Depends(get_db)):
     }
 
 @app.get("/students")
-def get_all_students(db: Session = Depends(get_db)):
+def get_all_students(accept: Optional[str] = Header(None), db: Session = Depends(get_db)):
     query = text("""
         SELECT 
             s.id AS student_id, s.name, s.student_code,
@@ -70,8 +117,7 @@ def get_all_students(db: Session = Depends(get_db)):
         ORDER BY s.name ASC
     """)
     result = db.execute(query)
-    # Convert to list of dicts for proper serialization
-    return [dict(row._mapping) for row in result]
+    return serialization.rows_response(result, serialization.STUDENTS_SCHEMA, accept)
 
 @app.post("/students/upload-csv")
 def upload_students_csv(file: UploadFile = File(...), db: Session = Depends(get_db)):
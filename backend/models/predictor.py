@@ -32,4 +32,13 @@ class StudentPredictor:
         # (e.g. if we predict Fail, this is the probability of Fail)
         confidence = float(probs[prediction])
         
-        return prediction, confidence
\ No newline at end of file
+        return prediction, confidence
+
+    def predict_batch(self, features):
+        """Predict pass/fail for an (n, 4) array of term1, term2, term3, attendance_score."""
+        if self.model is None:
+            return None
+        features = np.asarray(features, dtype=float).reshape(-1, 4)
+        if len(features) == 0:
+            return np.zeros(0, dtype=int)
+        return self.model.predict(features).astype(int)
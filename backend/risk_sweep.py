@@ -0,0 +1,39 @@
+import numpy as np
+
+
+def threshold_grid(start: int, stop: int, step: int):
+    """Inclusive integer threshold range, e.g. (70, 80, 5) -> [70, 75, 80]."""
+    return list(range(start, stop + 1, step))
+
+
+def count_at_risk_grid(attendance, min_grade, attendance_thresholds, grade_thresholds):
+    """
+    Count at-risk students for every (attendance, grade) threshold pair.
+
+    A student is at risk for a pair (a, g) when attendance < a OR min_grade < g,
+    which mirrors crud.get_students_at_risk. Each student is binned once by how
+    many thresholds they clear on each axis; a reversed 2D cumulative sum of
+    that histogram then gives the "safe" count for every cell, so the cost is
+    O(n log k + k^2) instead of one query per cell. Thresholds must be sorted
+    ascending.
+    """
+    att_t = np.asarray(attendance_thresholds, dtype=float)
+    grade_t = np.asarray(grade_thresholds, dtype=float)
+    attendance = np.asarray(attendance, dtype=float)
+    min_grade = np.asarray(min_grade, dtype=float)
+
+    # Number of thresholds t with t <= value, i.e. the student is safe on this
+    # axis for the first `cleared` thresholds.
+    att_cleared = np.searchsorted(att_t, attendance, side="right")
+    grade_cleared = np.searchsorted(grade_t, min_grade, side="right")
+
+    rows, cols = len(att_t) + 1, len(grade_t) + 1
+    hist = np.bincount(
+        att_cleared * cols + grade_cleared, minlength=rows * cols
+    ).reshape(rows, cols)
+
+    # safe[i, j] = students with att_cleared >= i and grade_cleared >= j
+    safe = hist[::-1, ::-1].cumsum(axis=0).cumsum(axis=1)[::-1, ::-1]
+
+    # Safe for threshold index (k, l) means att_cleared > k and grade_cleared > l.
+    return len(attendance) - safe[1:, 1:]
@@ -23,4 +23,12 @@ class RealTimePredictionInput(BaseModel):
     term1: float
     term2: float
     term3: float
-    attendance_score: float
\ No newline at end of file
+    attendance_score: float
+
+class RiskSweep(BaseModel):
+    attendance_thresholds: list[int]
+    grade_thresholds: list[int]
+    total_students: int
+    # at_risk[i][j] is the count for attendance_thresholds[i] and grade_thresholds[j]
+    at_risk: list[list[int]]
+    predicted_fail: Optional[list[list[int]]] = None
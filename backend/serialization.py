@@ -0,0 +1,69 @@
+import io
+from typing import Optional
+
+import orjson
+import pyarrow as pa
+from fastapi import Response
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+BATCH_SIZE = 10_000
+
+# Explicit schemas so a batch that happens to be all-NULL in one column
+# (e.g. students without grades on the LEFT JOIN) still gets the right type.
+AT_RISK_SCHEMA = pa.schema([
+    ("student_id", pa.int64()),
+    ("name", pa.string()),
+    ("student_code", pa.string()),
+    ("total_classes", pa.int64()),
+    ("present_count", pa.int64()),
+    ("attendance_percentage", pa.float64()),
+    ("term1", pa.float64()),
+    ("term2", pa.float64()),
+    ("term3", pa.float64()),
+])
+
+STUDENTS_SCHEMA = pa.schema([
+    ("student_id", pa.int64()),
+    ("name", pa.string()),
+    ("student_code", pa.string()),
+    ("attendance_percentage", pa.float64()),
+    ("term1", pa.float64()),
+    ("term2", pa.float64()),
+    ("term3", pa.float64()),
+])
+
+
+def rows_to_json(result) -> bytes:
+    """Serialize a SQLAlchemy result with orjson, skipping pydantic and jsonable_encoder."""
+    keys = list(result.keys())
+    return orjson.dumps([dict(zip(keys, row)) for row in result])
+
+
+def rows_to_arrow(result, schema: pa.Schema, batch_size: int = BATCH_SIZE) -> bytes:
+    """Write a SQLAlchemy result as Arrow IPC stream batches, fetching batch_size rows at a time."""
+    keys = list(result.keys())
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        while True:
+            rows = result.fetchmany(batch_size)
+            if not rows:
+                break
+            columns = dict(zip(keys, zip(*rows)))
+            batch = pa.RecordBatch.from_arrays(
+                [pa.array(columns[field.name], type=field.type) for field in schema],
+                schema=schema
+            )
+            writer.write_batch(batch)
+    return sink.getvalue()
+
+
+def wants_arrow(accept: Optional[str]) -> bool:
+    return bool(accept) and ARROW_STREAM_MEDIA_TYPE in accept
+
+
+def rows_response(result, schema: pa.Schema, accept: Optional[str] = None) -> Response:
+    """Build a JSON or Arrow IPC response for a result depending on the Accept header."""
+    headers = {"Vary": "Accept"}
+    if wants_arrow(accept):
+        return Response(content=rows_to_arrow(result, schema), media_type=ARROW_STREAM_MEDIA_TYPE, headers=headers)
+    return Response(content=rows_to_json(result), media_type="application/json", headers=headers)
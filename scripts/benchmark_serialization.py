@@ -0,0 +1,105 @@
+import sys
+import os
+# Add project root to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import random
+import time
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, text
+
+from backend import schemas, serialization
+
+ROWS = 100_000
+REPEATS = 3
+
+AT_RISK_QUERY = text("""
+    SELECT
+        s.id AS student_id,
+        s.name,
+        s.student_code,
+        0 AS total_classes,
+        0 AS present_count,
+        g.attendance_score AS attendance_percentage,
+        g.term1,
+        g.term2,
+        g.term3
+    FROM students s
+    INNER JOIN grades g ON s.id = g.student_id
+    ORDER BY g.attendance_score ASC
+""")
+
+def build_database(rows):
+    """Creates an in-memory SQLite database with `rows` students and grades."""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE students (
+                id INTEGER PRIMARY KEY, name TEXT NOT NULL, student_code TEXT NOT NULL
+            )
+        """))
+        conn.execute(text("""
+            CREATE TABLE grades (
+                student_id INTEGER NOT NULL,
+                term1 REAL NOT NULL, term2 REAL NOT NULL, term3 REAL NOT NULL,
+                attendance_score REAL NOT NULL
+            )
+        """))
+        conn.execute(
+            text("INSERT INTO students (id, name, student_code) VALUES (:id, :n, :c)"),
+            [{"id": i, "n": f"Student {i}", "c": f"S{i}"} for i in range(1, rows + 1)]
+        )
+        conn.execute(
+            text("INSERT INTO grades VALUES (:id, :t1, :t2, :t3, :att)"),
+            [{
+                "id": i,
+                "t1": random.uniform(10, 95), "t2": random.uniform(10, 95), "t3": random.uniform(10, 95),
+                "att": random.uniform(40, 100)
+            } for i in range(1, rows + 1)]
+        )
+    return engine
+
+def default_path(result):
+    # What FastAPI did before: dict per row, response_model validation, jsonable_encoder, json.dumps
+    rows = [dict(row._mapping) for row in result]
+    validated = TypeAdapter(list[schemas.AttendanceRisk]).validate_python(rows)
+    return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+def orjson_path(result):
+    return serialization.rows_to_json(result)
+
+def arrow_path(result):
+    return serialization.rows_to_arrow(result, serialization.AT_RISK_SCHEMA)
+
+def run_benchmark():
+    print(f"Building {ROWS} rows in SQLite...")
+    engine = build_database(ROWS)
+
+    formats = {
+        "json (pydantic + jsonable_encoder)": default_path,
+        "json (orjson)": orjson_path,
+        "arrow ipc stream": arrow_path,
+    }
+
+    with engine.connect() as conn:
+        # Baseline: time spent just fetching rows, to compare against serialization
+        start = time.perf_counter()
+        conn.execute(AT_RISK_QUERY).fetchall()
+        print(f"\nSQL fetch only: {(time.perf_counter() - start) * 1000:.1f} ms\n")
+
+        print(f"{'Format':<36} {'Time (ms)':>10} {'Size (KB)':>12}")
+        for name, fn in formats.items():
+            best = float("inf")
+            payload = b""
+            for _ in range(REPEATS):
+                result = conn.execute(AT_RISK_QUERY)
+                start = time.perf_counter()
+                payload = fn(result)
+                best = min(best, time.perf_counter() - start)
+            print(f"{name:<36} {best * 1000:>10.1f} {len(payload) / 1024:>12.1f}")
+
+if __name__ == "__main__":
+    run_benchmark()